@@ -1,17 +1,51 @@
 # src/balance_controller.py
 
+import sys
 import threading
 import time
 import math
 import warnings
-from dataclasses import dataclass
-from ctypes import cast, POINTER
-from typing import Optional
-from comtypes import CLSCTX_ALL
+import ctypes
+from dataclasses import dataclass, field
+from ctypes import cast, wintypes, POINTER
+from typing import Any, Callable, List, Optional, Tuple
+
+# Join the multithreaded COM apartment once for the whole process, so the
+# endpoint can be used from the GUI and 8D threads without re-initializing
+# COM. comtypes reads this flag when it is first imported.
+sys.coinit_flags = 0  # COINIT_MULTITHREADED
+
+from comtypes import CLSCTX_ALL, GUID
+from pycaw.callbacks import AudioEndpointVolumeCallback, MMNotificationClient
+from pycaw.constants import EDataFlow
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 
+# Default number of balance samples per full 8D pan cycle
+_8D_STEPS_PER_CYCLE = 50
+
+# Channel scalar changes smaller than this are not written to the endpoint
+_SCALAR_EPSILON = 1e-3
+
+# IAudioEndpointVolume::SetChannelVolumeLevelScalar: 3 IUnknown slots + 8
+_SET_CHANNEL_VOLUME_LEVEL_SCALAR_SLOT = 11
+_SetChannelVolumeLevelScalarProto = ctypes.WINFUNCTYPE(
+    ctypes.HRESULT, ctypes.c_void_p, wintypes.UINT, ctypes.c_float, POINTER(GUID)
+)
+
+# Win32 waitable timer constants
+_CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+_TIMER_ALL_ACCESS = 0x001F0003
+_INFINITE = 0xFFFFFFFF
+
+
+def _clamp_percent(value: int) -> int:
+    """
+    Clamp a percentage to [0, 100] without the max()/min() call overhead.
+    """
+    return 0 if value < 0 else 100 if value > 100 else value
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RightLeftVolumeIntensity:
     """
     Represents independent left/right channel volume intensities as percentages.
@@ -19,14 +53,142 @@ class RightLeftVolumeIntensity:
     Attributes:
         left_percent:  Left channel intensity in the range [0, 100].
         right_percent: Right channel intensity in the range [0, 100].
+        left_scalar:   left_percent as an endpoint scalar in [0.0, 1.0].
+        right_scalar:  right_percent as an endpoint scalar in [0.0, 1.0].
     """
     left_percent: int
     right_percent: int
+    left_scalar: float = field(init=False, repr=False, compare=False)
+    right_scalar: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # Clamp to valid range
-        object.__setattr__(self, 'left_percent',  max(0, min(100, self.left_percent)))
-        object.__setattr__(self, 'right_percent', max(0, min(100, self.right_percent)))
+        left = _clamp_percent(self.left_percent)
+        right = _clamp_percent(self.right_percent)
+        object.__setattr__(self, 'left_percent',  left)
+        object.__setattr__(self, 'right_percent', right)
+        object.__setattr__(self, 'left_scalar',  left / 100.0)
+        object.__setattr__(self, 'right_scalar', right / 100.0)
+
+
+class _WaitableTimerSleeper:
+    """
+    Sleeps on a Win32 waitable timer instead of the ~15.6 ms system tick.
+
+    Uses a high-resolution timer on Windows 10 1803+, otherwise a regular
+    waitable timer with the system timer period raised to 1 ms. Falls back
+    to time.sleep when no timer can be created.
+    """
+
+    def __init__(self) -> None:
+        self._timer: Optional[int] = None
+        self._winmm = None
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        kernel32.CreateWaitableTimerExW.argtypes = (
+            ctypes.c_void_p, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD
+        )
+        kernel32.SetWaitableTimer.restype = wintypes.BOOL
+        kernel32.SetWaitableTimer.argtypes = (
+            wintypes.HANDLE, POINTER(wintypes.LARGE_INTEGER), wintypes.LONG,
+            ctypes.c_void_p, ctypes.c_void_p, wintypes.BOOL
+        )
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        self._kernel32 = kernel32
+
+        timer = kernel32.CreateWaitableTimerExW(
+            None, None, _CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, _TIMER_ALL_ACCESS
+        )
+        if not timer:
+            # Older Windows: plain timer, with the system tick raised to 1 ms
+            timer = kernel32.CreateWaitableTimerExW(None, None, 0, _TIMER_ALL_ACCESS)
+            winmm = ctypes.WinDLL("winmm")
+            if winmm.timeBeginPeriod(1) == 0:
+                self._winmm = winmm
+        self._timer = timer or None
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Block the calling thread for the given duration.
+
+        Args:
+            seconds: Time to sleep; non-positive values return immediately.
+        """
+        if seconds <= 0:
+            return
+        if self._timer is None:
+            time.sleep(seconds)
+            return
+
+        # Negative due time means relative, in 100 ns units
+        due = wintypes.LARGE_INTEGER(-int(seconds * 10_000_000))
+        if not self._kernel32.SetWaitableTimer(
+            self._timer, ctypes.byref(due), 0, None, None, False
+        ):
+            time.sleep(seconds)
+            return
+        self._kernel32.WaitForSingleObject(self._timer, _INFINITE)
+
+    def close(self) -> None:
+        """
+        Release the timer handle and restore the system timer period.
+        """
+        if self._timer is not None:
+            self._kernel32.CloseHandle(self._timer)
+            self._timer = None
+        if self._winmm is not None:
+            self._winmm.timeEndPeriod(1)
+            self._winmm = None
+
+
+class _DefaultDeviceWatcher(MMNotificationClient):
+    """
+    Device notification client that reports changes of the default render device.
+    """
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        """
+        Args:
+            on_change: Called (on a COM worker thread) when the default
+                       render endpoint changes.
+        """
+        super().__init__()
+        self._on_change = on_change
+
+    def on_default_device_changed(
+        self, flow: str, flow_id: int, role: str, role_id: int, default_device_id: str
+    ) -> None:
+        if flow_id == EDataFlow.eRender.value:
+            self._on_change()
+
+
+class _VolumeChangeWatcher(AudioEndpointVolumeCallback):
+    """
+    Endpoint volume callback that reports changes made by other programs.
+    """
+
+    def __init__(self, own_context: GUID, on_external_change: Callable[[], None]) -> None:
+        """
+        Args:
+            own_context: Event context GUID tagging this controller's writes.
+            on_external_change: Called (on a COM worker thread) for volume
+                                changes carrying any other event context.
+        """
+        super().__init__()
+        self._own_context = own_context
+        self._on_external_change = on_external_change
+
+    def on_notify(
+        self, new_volume: float, new_mute: int, event_context: "POINTER(GUID)",
+        channels: int, channel_volumes: Any
+    ) -> None:
+        # pycaw passes a pointer to the notification's context GUID
+        if event_context.contents != self._own_context:
+            self._on_external_change()
 
 
 class BalanceController:
@@ -46,11 +208,59 @@ class BalanceController:
             None
         )
         self._endpoint_volume = cast(interface, POINTER(IAudioEndpointVolume))
+        # Default endpoint, reused by get_interface_name until it changes
+        self._speakers: Any = speakers
+
+        # Raw vtable entry for the per-sample channel writes, bypassing comtypes dispatch
+        vtbl = cast(self._endpoint_volume, POINTER(POINTER(ctypes.c_void_p)))[0]
+        self._set_channel_scalar = _SetChannelVolumeLevelScalarProto(
+            vtbl[_SET_CHANNEL_VOLUME_LEVEL_SCALAR_SLOT]
+        )
+        self._endpoint_this = cast(self._endpoint_volume, ctypes.c_void_p)
+
+        # Event context tagging our own channel writes; the pointer is built
+        # once so writes skip per-call POINTER(GUID) conversion
+        self._event_context = GUID.create_new()
+        self._event_context_ptr = ctypes.pointer(self._event_context)
 
         # 8D mode state
         self._8d_thread: Optional[threading.Thread] = None
         self._8d_running = threading.Event()
         self._8d_max_percent: int = 100
+        self._8d_depth_percent: int = 80
+        self._8d_steps_per_cycle: int = _8D_STEPS_PER_CYCLE
+        self._8d_table: List[Tuple[float, float]] = []
+        self._8d_tk_root: Any = None
+        self._8d_after_id: Optional[str] = None
+
+        # Last scalars written per channel (-1.0 forces the next write),
+        # dropped whenever another program changes the endpoint volume
+        self._last_left_scalar: float = -1.0
+        self._last_right_scalar: float = -1.0
+        self._volume_watcher: Optional[_VolumeChangeWatcher] = None
+        try:
+            volume_watcher = _VolumeChangeWatcher(
+                self._event_context, self._reset_last_scalars
+            )
+            self._endpoint_volume.RegisterControlChangeNotify(volume_watcher)
+            self._volume_watcher = volume_watcher
+        except Exception:
+            # Without notifications the cache is only reset by 8D start/stop
+            pass
+
+        # Cached friendly name of the default endpoint, dropped on device change
+        self._interface_name: Optional[str] = None
+        self._device_enumerator: Any = None
+        self._device_watcher: Optional[_DefaultDeviceWatcher] = None
+        try:
+            watcher = _DefaultDeviceWatcher(self.invalidate_interface_name)
+            enumerator = AudioUtilities.GetDeviceEnumerator()
+            enumerator.RegisterEndpointNotificationCallback(watcher)
+            self._device_enumerator = enumerator
+            self._device_watcher = watcher
+        except Exception:
+            # Without notifications the name simply stays cached
+            pass
 
     def set_balance(self, intensity: RightLeftVolumeIntensity) -> None:
         """
@@ -59,79 +269,226 @@ class BalanceController:
         Args:
             intensity: A RightLeftVolumeIntensity with values in [0, 100].
         """
-        left_scalar = intensity.left_percent / 100.0
-        right_scalar = intensity.right_percent / 100.0
+        self._set_scalars(intensity.left_scalar, intensity.right_scalar)
+
+    def set_balance_percent(self, left_percent: int, right_percent: int) -> None:
+        """
+        Set left/right volume percentages without building an intensity object.
+
+        Args:
+            left_percent:  Left channel intensity; clamped to [0, 100].
+            right_percent: Right channel intensity; clamped to [0, 100].
+        """
+        self._set_scalars(
+            _clamp_percent(left_percent) / 100.0,
+            _clamp_percent(right_percent) / 100.0,
+        )
+
+    def _set_scalars(self, left_scalar: float, right_scalar: float) -> None:
+        """
+        Write raw left/right volume scalars to the endpoint without clamping.
 
-        self._endpoint_volume.SetChannelVolumeLevelScalar(0, left_scalar, None)
-        self._endpoint_volume.SetChannelVolumeLevelScalar(1, right_scalar, None)
+        Channels whose value has not changed since the last write are skipped.
+
+        Args:
+            left_scalar:  Left channel volume in the range [0.0, 1.0].
+            right_scalar: Right channel volume in the range [0.0, 1.0].
+        """
+        # IAudioEndpointVolume has no multi-channel setter (IChannelAudioVolume's
+        # SetAllVolumes only covers a single app session), so channels are
+        # written one at a time.
+        if abs(left_scalar - self._last_left_scalar) > _SCALAR_EPSILON:
+            self._set_channel_scalar(self._endpoint_this, 0, left_scalar, self._event_context_ptr)
+            self._last_left_scalar = left_scalar
+        if abs(right_scalar - self._last_right_scalar) > _SCALAR_EPSILON:
+            self._set_channel_scalar(self._endpoint_this, 1, right_scalar, self._event_context_ptr)
+            self._last_right_scalar = right_scalar
+
+    def _reset_last_scalars(self) -> None:
+        """
+        Forget the last written scalars so the next write always reaches COM.
+        """
+        self._last_left_scalar = -1.0
+        self._last_right_scalar = -1.0
 
     def get_balance(self) -> RightLeftVolumeIntensity:
         """
         Query the current left/right volume percentages.
 
+        Values written by this controller are returned from cache; the
+        endpoint is only read when nothing has been written since the last
+        reset, which also happens whenever another program changes the
+        endpoint volume.
+
         Returns:
             A RightLeftVolumeIntensity reflecting the current endpoint balance.
         """
-        left_scalar = self._endpoint_volume.GetChannelVolumeLevelScalar(0)
-        right_scalar = self._endpoint_volume.GetChannelVolumeLevelScalar(1)
+        left_scalar = self._last_left_scalar
+        right_scalar = self._last_right_scalar
+        if left_scalar < 0 or right_scalar < 0:
+            left_scalar = self._endpoint_volume.GetChannelVolumeLevelScalar(0)
+            right_scalar = self._endpoint_volume.GetChannelVolumeLevelScalar(1)
+            self._last_left_scalar = left_scalar
+            self._last_right_scalar = right_scalar
         return RightLeftVolumeIntensity(
             left_percent=round(left_scalar * 100),
             right_percent=round(right_scalar * 100),
         )
 
-    def _run_8d(self, rate_hz: float, depth_percent: int) -> None:
+    def _build_8d_table(self) -> List[Tuple[float, float]]:
+        """
+        Precompute one full 8D pan cycle as (left, right) volume scalars.
+
+        The sine, depth, and max cap are all fixed for the lifetime of a
+        table, so the panning loop only has to index into it.
+
+        Returns:
+            A list of steps-per-cycle (left_scalar, right_scalar) pairs.
+        """
+        half_depth = self._8d_depth_percent / 2.0
+        cap = self._8d_max_percent / 100.0
+        phase_step = 2 * math.pi / self._8d_steps_per_cycle
+
+        # map sine [-1,1] to [50-depth/2 ... 50+depth/2] for the left channel
+        raw_lefts = [
+            50.0 + math.sin(step * phase_step) * half_depth
+            for step in range(self._8d_steps_per_cycle)
+        ]
+
+        # apply max cap, truncating to whole percentages
+        return [
+            (int(raw_left * cap) / 100.0, int((100.0 - raw_left) * cap) / 100.0)
+            for raw_left in raw_lefts
+        ]
+
+    def _run_8d(self, rate_hz: float) -> None:
         """
         Internal loop for 8D auto-panning: sweeps L↔R in a sine wave.
 
         Args:
             rate_hz: Number of full L→R→L cycles per second.
-            depth_percent: Peak-to-peak swing around center (0–100).
-        """
-        interval = 1.0 / (rate_hz * 50)  # 50 steps per cycle
-        t = 0.0
-        half_depth = depth_percent / 2.0
-
-        while self._8d_running.is_set():
-            # sine in [-1,1]
-            v = math.sin(2 * math.pi * rate_hz * t)
-            
-            # map to [50-depth/2 ... 50+depth/2]
-            raw_left = 50.0 + v * half_depth
-            raw_right = 100.0 - raw_left
-
-            # apply max cap
-            left = raw_left * self._8d_max_percent / 100.0
-            right = raw_right * self._8d_max_percent / 100.0
-
-            # set balance
-            self.set_balance(
-                RightLeftVolumeIntensity(
-                    left_percent=int(left),
-                    right_percent=int(right)
-                )
-            )
+        """
+        steps = self._8d_steps_per_cycle
+        interval = 1.0 / (rate_hz * steps)
+        step = 0
+        sleeper = _WaitableTimerSleeper()
+
+        # Bind hot-loop lookups to locals (LOAD_FAST instead of LOAD_ATTR/GLOBAL)
+        is_running = self._8d_running.is_set
+        set_scalars = self._set_scalars
+        perf_counter = time.perf_counter
+        sleep = sleeper.sleep
+
+        # Wake-ups are scheduled against absolute deadlines so COM call time
+        # does not accumulate into the pan period.
+        next_t = perf_counter()
+
+        try:
+            while is_running():
+                # Re-read the table each step so cap changes apply immediately
+                left_scalar, right_scalar = self._8d_table[step]
+                set_scalars(left_scalar, right_scalar)
+
+                step = (step + 1) % steps
+                next_t += interval
+                delay = next_t - perf_counter()
+                if delay < 0:
+                    # Fell behind: drop the missed samples to keep the phase on time
+                    missed = int(-delay // interval) + 1
+                    step = (step + missed) % steps
+                    next_t += missed * interval
+                    delay += missed * interval
+                sleep(delay)
+        finally:
+            sleeper.close()
+
+    def _prepare_8d(self, depth_percent: int, steps_per_cycle: int) -> None:
+        """
+        Build the pan table and mark 8D as running, for either driver.
 
-            t += interval
-            time.sleep(interval)
+        Args:
+            depth_percent: Total left↔right swing (0–100).
+            steps_per_cycle: Balance samples per cycle.
+        """
+        self._8d_depth_percent = _clamp_percent(depth_percent)
+        self._8d_steps_per_cycle = max(1, steps_per_cycle)
+        self._8d_table = self._build_8d_table()
+        self._reset_last_scalars()
+        self._8d_running.set()
 
-    def start_8d(self, rate_hz: float = 0.2, depth_percent: int = 80) -> None:
+    def start_8d(
+        self,
+        rate_hz: float = 0.2,
+        depth_percent: int = 80,
+        steps_per_cycle: int = _8D_STEPS_PER_CYCLE,
+    ) -> None:
         """
         Enable 8D auto-panning in background.
 
         Args:
             rate_hz: Frequency of pan cycles (Hz).
             depth_percent: Total left↔right swing (0–100).
+            steps_per_cycle: Balance samples per cycle; higher is smoother.
         """
         if self._8d_running.is_set():
             return
-        self._8d_running.set()
+        self._prepare_8d(depth_percent, steps_per_cycle)
         self._8d_thread = threading.Thread(
             target=self._run_8d, 
-            args=(rate_hz, depth_percent), 
+            args=(rate_hz,), 
             daemon=True
         )
         self._8d_thread.start()
 
+    def start_8d_in_tk(
+        self,
+        tk_root: Any,
+        rate_hz: float = 0.2,
+        depth_percent: int = 80,
+        steps_per_cycle: int = _8D_STEPS_PER_CYCLE,
+    ) -> None:
+        """
+        Enable 8D auto-panning driven by a Tk event loop instead of a thread.
+
+        Each step is scheduled with tk_root.after(), so the COM writes happen
+        on the GUI thread and no extra OS thread is created.
+
+        Args:
+            tk_root: Any Tk widget whose after() schedules the steps.
+            rate_hz: Frequency of pan cycles (Hz).
+            depth_percent: Total left↔right swing (0–100).
+            steps_per_cycle: Balance samples per cycle; higher is smoother.
+        """
+        if self._8d_running.is_set():
+            return
+        self._prepare_8d(depth_percent, steps_per_cycle)
+        self._8d_tk_root = tk_root
+        interval = 1.0 / (rate_hz * self._8d_steps_per_cycle)
+        self._tick_8d(interval, time.perf_counter())
+
+    def _tick_8d(self, interval: float, start_t: float) -> None:
+        """
+        Write the current 8D sample and schedule the next Tk tick.
+
+        The step is derived from elapsed time, so late ticks skip samples
+        rather than slowing the sweep down.
+
+        Args:
+            interval: Seconds between samples.
+            start_t: perf_counter() value when panning started.
+        """
+        if not self._8d_running.is_set():
+            return
+        elapsed = time.perf_counter() - start_t
+        step_count = int(elapsed / interval)
+        left_scalar, right_scalar = self._8d_table[step_count % self._8d_steps_per_cycle]
+        self._set_scalars(left_scalar, right_scalar)
+
+        delay_ms = math.ceil(((step_count + 1) * interval - elapsed) * 1000)
+        self._8d_after_id = self._8d_tk_root.after(
+            max(1, delay_ms), self._tick_8d, interval, start_t
+        )
+
     def stop_8d(self) -> None:
         """
         Disable 8D auto-panning, leaving the last balance in place.
@@ -140,6 +497,11 @@ class BalanceController:
         if self._8d_thread:
             self._8d_thread.join(timeout=0.1)
             self._8d_thread = None
+        if self._8d_after_id is not None:
+            self._8d_tk_root.after_cancel(self._8d_after_id)
+            self._8d_after_id = None
+            self._8d_tk_root = None
+        self._reset_last_scalars()
 
     def set_8d_max_percent(self, max_percent: int) -> None:
         """
@@ -148,29 +510,72 @@ class BalanceController:
         Args:
             max_percent: New cap (0–100).
         """
-        self._8d_max_percent = max(0, min(100, max_percent))
+        self._8d_max_percent = _clamp_percent(max_percent)
+        if self._8d_running.is_set():
+            self._8d_table = self._build_8d_table()
 
     def get_interface_name(self) -> str:
         """
         Return the friendly name of the default audio endpoint.
 
+        The name is looked up once and cached until the default device
+        changes (see invalidate_interface_name()).
+
         Returns:
             e.g., "Speakers (Realtek High Definition Audio)" or "Unknown Device"
         """
+        if self._interface_name is not None:
+            return self._interface_name
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", UserWarning)
 
-            device = AudioUtilities.GetSpeakers()
+            # Read once: the device watcher may clear it from another thread
+            device = self._speakers
+            if device is None:
+                device = self._speakers = AudioUtilities.GetSpeakers()
             try:
                 device_id = device.GetId()
             except Exception:
                 return "Unknown Device"
 
+            name = device_id
             try:
-                for dev in AudioUtilities.GetAllDevices():
-                    if getattr(dev, "id", None) == device_id:
-                        return dev.FriendlyName
+                name_by_id = {
+                    getattr(dev, "id", None): getattr(dev, "FriendlyName", None)
+                    for dev in AudioUtilities.GetAllDevices()
+                }
+                name = name_by_id.get(device_id) or device_id
             except Exception:
                 pass
 
-            return device_id
+            self._interface_name = name
+            return name
+
+    def invalidate_interface_name(self) -> None:
+        """
+        Drop the cached endpoint name so the next lookup re-queries it.
+        """
+        self._interface_name = None
+        self._speakers = None
+
+    def close(self) -> None:
+        """
+        Stop 8D panning and unregister the endpoint notifications.
+        """
+        self.stop_8d()
+        if self._volume_watcher is not None:
+            try:
+                self._endpoint_volume.UnregisterControlChangeNotify(self._volume_watcher)
+            except Exception:
+                pass
+            self._volume_watcher = None
+        if self._device_watcher is not None:
+            try:
+                self._device_enumerator.UnregisterEndpointNotificationCallback(
+                    self._device_watcher
+                )
+            except Exception:
+                pass
+            self._device_enumerator = None
+            self._device_watcher = None
@@ -2,10 +2,27 @@
 
 import tkinter as tk
 from tkinter import ttk
-import sv_ttk
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
-from balance_controller import BalanceController, RightLeftVolumeIntensity
+from balance_controller import BalanceController
+
+# Minimum delay between balance writes while a slider is being dragged
+_FLUSH_DELAY_MS = 20
+
+# Label text for every slider position, so drag updates allocate no strings
+_PCT_STR = tuple(str(i) for i in range(101))
+
+# Shared grid() options for left-aligned and horizontally stretched cells
+_GRID_W = {"sticky": "w"}
+_GRID_EW = {"sticky": "ew"}
+
+# Reusable ttk state specs for enabling/disabling widgets
+_DISABLED = ("disabled",)
+_ENABLED = ("!disabled",)
+
+# How often startup checks whether the controller is ready
+_CONTROLLER_POLL_MS = 20
 
 class BalanceApp(ttk.Frame):
     """
@@ -21,78 +38,125 @@ class BalanceApp(ttk.Frame):
         super().__init__(master, padding=20)
         self.controller = controller
         self.is_8d_enabled: bool = False
+        self._pending_after: Optional[str] = None
 
         # Initial state
         initial = self.controller.get_balance()
         interface_name = self.controller.get_interface_name()
 
+        # Last values handed to the controller, to drop no-op writes
+        self._last_sent: Tuple[Optional[int], Optional[int]] = (
+            initial.left_percent, initial.right_percent
+        )
+        self._last_max: int = 100
+
+        # Current slider positions, kept in Python so flushes skip Tcl reads
+        self._left: int = initial.left_percent
+        self._right: int = initial.right_percent
+        self._max: int = 100
+
         # Interface name display
-        ttk.Label(self, text="Interface:").grid(column=0, row=0, sticky="w")
+        ttk.Label(self, text="Interface:").grid(column=0, row=0, **_GRID_W)
         self.interface_label = ttk.Label(self, text=interface_name)
-        self.interface_label.grid(column=1, row=0, columnspan=2, sticky="w")
+        self.interface_label.grid(column=1, row=0, columnspan=2, **_GRID_W)
 
         # Left channel slider
-        ttk.Label(self, text="Left (%)").grid(column=0, row=1, sticky="w")
-        self.left_var = tk.IntVar(value=initial.left_percent)
+        ttk.Label(self, text="Left (%)").grid(column=0, row=1, **_GRID_W)
+        self.left_var = tk.DoubleVar(value=initial.left_percent)
+        self.left_var.trace_add("write", self._on_channel_change)
         self.left_slider = ttk.Scale(
-            self, from_=0, to=100, orient="horizontal",
-            variable=self.left_var, command=self._on_manual_slide
+            self, from_=0, to=100, orient="horizontal", variable=self.left_var
         )
-        self.left_slider.grid(column=1, row=1, sticky="ew")
+        self.left_slider.grid(column=1, row=1, **_GRID_EW)
+        self.left_slider.bind("<ButtonRelease-1>", self._on_slider_release)
         self.left_value_label = ttk.Label(self, text=str(initial.left_percent))
-        self.left_value_label.grid(column=2, row=1, sticky="w")
+        self.left_value_label.grid(column=2, row=1, **_GRID_W)
 
         # Right channel slider
-        ttk.Label(self, text="Right (%)").grid(column=0, row=2, sticky="w")
-        self.right_var = tk.IntVar(value=initial.right_percent)
+        ttk.Label(self, text="Right (%)").grid(column=0, row=2, **_GRID_W)
+        self.right_var = tk.DoubleVar(value=initial.right_percent)
+        self.right_var.trace_add("write", self._on_channel_change)
         self.right_slider = ttk.Scale(
-            self, from_=0, to=100, orient="horizontal",
-            variable=self.right_var, command=self._on_manual_slide
+            self, from_=0, to=100, orient="horizontal", variable=self.right_var
         )
-        self.right_slider.grid(column=1, row=2, sticky="ew")
+        self.right_slider.grid(column=1, row=2, **_GRID_EW)
+        self.right_slider.bind("<ButtonRelease-1>", self._on_slider_release)
         self.right_value_label = ttk.Label(self, text=str(initial.right_percent))
-        self.right_value_label.grid(column=2, row=2, sticky="w")
+        self.right_value_label.grid(column=2, row=2, **_GRID_W)
 
         # 8D toggle
         self.toggle_button = ttk.Button(
             self, text="Enable 8D Audio", command=self._toggle_8d_mode
         )
-        self.toggle_button.grid(column=0, row=3, columnspan=2, sticky="ew", pady=(10, 0))
+        self.toggle_button.grid(column=0, row=3, columnspan=2, pady=(10, 0), **_GRID_EW)
 
         self.mode_indicator = ttk.Label(self, text="8D OFF", foreground="red")
-        self.mode_indicator.grid(column=2, row=3, sticky="w")
+        self.mode_indicator.grid(column=2, row=3, **_GRID_W)
 
         # 8D max-cap slider
-        ttk.Label(self, text="8D Max (%)").grid(column=0, row=4, sticky="w")
-        self.max_var = tk.IntVar(value=100)
+        ttk.Label(self, text="8D Max (%)").grid(column=0, row=4, **_GRID_W)
+        self.max_var = tk.DoubleVar(value=100)
         self.max_slider = ttk.Scale(
             self, from_=0, to=100, orient="horizontal",
             variable=self.max_var, command=self._on_max_change
         )
-        self.max_slider.grid(column=1, row=4, sticky="ew")
+        self.max_slider.grid(column=1, row=4, **_GRID_EW)
+        self.max_slider.bind("<ButtonRelease-1>", self._on_slider_release)
         self.max_value_label = ttk.Label(self, text="100")
-        self.max_value_label.grid(column=2, row=4, sticky="w")
-        self.max_slider.state(["disabled"])
+        self.max_value_label.grid(column=2, row=4, **_GRID_W)
+        self.max_slider.state(_DISABLED)
 
         # Layout & title
         self.columnconfigure(1, weight=1)
         self.pack(fill="both", expand=True)
-        master.title("8D Audio Balance Controller")
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def _on_manual_slide(self, _event: Any) -> None:
+    def _on_channel_change(self, var_name: str, *_trace_args: Any) -> None:
         """
-        Handle manual slider movement when 8D is off.
+        Handle writes to either manual slider variable when 8D is off.
+
+        Only the variable that was written is read back, identified by the
+        Tcl name the trace passes in.
         """
         if self.is_8d_enabled:
             return
-        
-        left = self.left_var.get()
-        right = self.right_var.get()
-        self.left_value_label.config(text=str(left))
-        self.right_value_label.config(text=str(right))
-        
-        intensity = RightLeftVolumeIntensity(left_percent=left, right_percent=right)
-        self.controller.set_balance(intensity)
+
+        if var_name == str(self.left_var):
+            self._left = int(self.left_var.get())
+            self.tk.call(self.left_value_label, "configure", "-text", _PCT_STR[self._left])
+        else:
+            self._right = int(self.right_var.get())
+            self.tk.call(self.right_value_label, "configure", "-text", _PCT_STR[self._right])
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """
+        Throttle controller writes to at most one per _FLUSH_DELAY_MS while dragging.
+        """
+        if self._pending_after is None:
+            self._pending_after = self.after(_FLUSH_DELAY_MS, self._flush_pending)
+
+    def _on_slider_release(self, _event: Any) -> None:
+        """
+        Apply the final slider positions as soon as the mouse is released.
+        """
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """
+        Push the latest slider values that changed to the controller.
+        """
+        self._pending_after = None
+
+        if not self.is_8d_enabled and (self._left, self._right) != self._last_sent:
+            self.controller.set_balance_percent(self._left, self._right)
+            self._last_sent = (self._left, self._right)
+
+        if self._max != self._last_max:
+            self.controller.set_8d_max_percent(self._max)
+            self._last_max = self._max
 
     def _toggle_8d_mode(self) -> None:
         """
@@ -100,46 +164,134 @@ class BalanceApp(ttk.Frame):
         """
         if not self.is_8d_enabled:
             # Start 8D audio panning
-            self.controller.start_8d(rate_hz=0.1, depth_percent=90)
-            self.toggle_button.config(text="Disable 8D Audio")
-            self.mode_indicator.config(text="8D ON", foreground="green")
+            self.controller.start_8d_in_tk(self, rate_hz=0.1, depth_percent=90)
+            self.tk.call(self.toggle_button, "configure", "-text", "Disable 8D Audio")
+            self.tk.call(
+                self.mode_indicator, "configure", "-text", "8D ON", "-foreground", "green"
+            )
             
-            self.left_slider.state(["disabled"])
-            self.right_slider.state(["disabled"])
-            self.max_slider.state(["!disabled"])
+            self.left_slider.state(_DISABLED)
+            self.right_slider.state(_DISABLED)
+            self.max_slider.state(_ENABLED)
         else:
-            # Stop 8D audio panning
+            # Stop 8D audio panning; the endpoint no longer matches _last_sent
             self.controller.stop_8d()
-            self.toggle_button.config(text="Enable 8D Audio")
-            self.mode_indicator.config(text="8D OFF", foreground="red")
+            self._last_sent = (None, None)
+            self.tk.call(self.toggle_button, "configure", "-text", "Enable 8D Audio")
+            self.tk.call(
+                self.mode_indicator, "configure", "-text", "8D OFF", "-foreground", "red"
+            )
             
-            self.left_slider.state(["!disabled"])
-            self.right_slider.state(["!disabled"])
-            self.max_slider.state(["disabled"])
+            self.left_slider.state(_ENABLED)
+            self.right_slider.state(_ENABLED)
+            self.max_slider.state(_DISABLED)
             
         # Update max slider state
         self.is_8d_enabled = not self.is_8d_enabled
 
-    def _on_max_change(self, _event: Any) -> None:
+    def _on_max_change(self, value: str) -> None:
         """
         Handle changes to the 8D maximum intensity cap.
+
+        The label updates immediately; the controller write goes through the
+        same throttled flush as the manual sliders.
+
+        Args:
+            value: New slider position as passed by the Scale's command.
+        """
+        self._max = int(float(value))
+        self.tk.call(self.max_value_label, "configure", "-text", _PCT_STR[self._max])
+        self._schedule_flush()
+
+    def _on_close(self) -> None:
+        """
+        Release the controller while Tk is still alive, then close the window.
         """
-        value = self.max_var.get()
-        self.max_value_label.config(text=str(value))
-        self.controller.set_8d_max_percent(value)
+        self.controller.close()
+        self.master.destroy()
+
+
+def _create_controller() -> BalanceController:
+    """
+    Build the controller and warm the lookups BalanceApp needs on startup.
+
+    Returns:
+        A BalanceController with its balance and interface name cached.
+    """
+    controller = BalanceController()
+    controller.get_balance()
+    controller.get_interface_name()
+    return controller
+
+
+def _install_when_ready(
+    root: tk.Tk,
+    controller_future: "Future[BalanceController]",
+    startup_errors: List[BaseException],
+) -> None:
+    """
+    Build, theme and show BalanceApp once the controller exists.
+
+    Exceptions raised inside a Tk callback are only printed, so failures are
+    stored in startup_errors and mainloop() is ended for main() to re-raise.
+
+    Args:
+        root: Root Tk window, still withdrawn.
+        controller_future: Pending BalanceController construction.
+        startup_errors: Collects the exception that aborted startup, if any.
+    """
+    if not controller_future.done():
+        root.after(
+            _CONTROLLER_POLL_MS, _install_when_ready, root, controller_future, startup_errors
+        )
+        return
+
+    try:
+        controller = controller_future.result()
+    except Exception as error:
+        startup_errors.append(error)
+        root.destroy()
+        return
+
+    try:
+        BalanceApp(root, controller)
+
+        # Imported here so importing this module does not load the theme package
+        import sv_ttk
+        sv_ttk.set_theme("dark")
+
+        # Show the window only now, so it is painted once, fully built and themed
+        root.deiconify()
+    except Exception as error:
+        startup_errors.append(error)
+        controller.close()
+        root.destroy()
 
 
 def main() -> None:
     """
     Launch the Tkinter GUI with Sun Valley theme.
+
+    The audio endpoint is probed on a worker thread while Tk starts up, so
+    COM enumeration overlaps interpreter and window creation.
     """
+    executor = ThreadPoolExecutor(max_workers=1)
+    controller_future = executor.submit(_create_controller)
+    executor.shutdown(wait=False)
+
     root = tk.Tk()
-    sv_ttk.set_theme("dark")
+    # Keep the window hidden until the app is built and themed
+    root.withdraw()
+    root.title("8D Audio Balance Controller")
 
-    controller = BalanceController()
-    BalanceApp(root, controller)
+    startup_errors: List[BaseException] = []
+    root.after(0, _install_when_ready, root, controller_future, startup_errors)
     root.mainloop()
 
+    # Surface startup failures to the caller
+    if startup_errors:
+        raise startup_errors[0]
+
 
 if __name__ == "__main__":
     main()